@@ -7,13 +7,106 @@ travel styles, and transport method. It reads data from files containing locatio
 processes this data, and creates an itinerary for the specified duration.
 """
 
+import mmap
+import os
+import pickle
 import random
+import re
+
+# The data files, and the cache of their parsed contents.
+_LOCATION_PATH = "itinerary_data/locations.txt"
+_ACTIVITY_PATH = "itinerary_data/activities.txt"
+_CACHE_PATH = "itinerary_data/cache.pkl"
+
+# Stored in the cache header, and increased whenever the format of the parsed tables changes.
+_CACHE_VERSION = 1
+
+# Matches every placeholder in an activity template, so they can be substituted in a single pass.
+_SUB_RE = re.compile(r"urban_attraction|natural_attraction|method_of_access|location|#")
+
+# The location types used to tag each line of the location data.
+_LOCATION_TYPES = ("urban_attraction", "natural_attraction")
+
+# Match a whole line of each data file. Location lines are formatted as "<location> <location type>
+# <destination>" and activity lines as "#<style tag> <activity template>".
+_LOCATION_RE = re.compile(rb"^(.*?)[ \t]+(urban_attraction|natural_attraction)[ \t]+(.*?)[ \t\r]*$", re.M)
+_ACTIVITY_RE = re.compile(rb"^#(\w+)[ \t]+(.*?)[ \t\r]*$", re.M)
+
+def _parse_data():
+    """
+    Reads the location and activity data files and parses them into lookup tables. Locations are keyed
+    by destination and then by location type, mapping to a list of attractions. Activities are keyed by
+    their lowercase style tag. Takes no parameters. Returns the location and activity tables.
+    """
+    
+    locations = {}
+    activities = {}
+    
+    # Memory-maps each file and parses every line in a single regex pass over the mapped pages.
+    with open(_LOCATION_PATH, "rb") as location_file, \
+         mmap.mmap(location_file.fileno(), 0, access=mmap.ACCESS_READ) as location_map:
+        for match in _LOCATION_RE.finditer(location_map):
+            location, location_type, destination = (group.decode("utf-8") for group in match.groups())
+            
+            if destination not in locations:
+                locations[destination] = {key: [] for key in _LOCATION_TYPES}
+            locations[destination][location_type].append(location)
+    
+    with open(_ACTIVITY_PATH, "rb") as activity_file, \
+         mmap.mmap(activity_file.fileno(), 0, access=mmap.ACCESS_READ) as activity_map:
+        for match in _ACTIVITY_RE.finditer(activity_map):
+            style_tag, activity = (group.decode("utf-8") for group in match.groups())
+            activities.setdefault(style_tag, []).append(activity)
+    
+    return locations, activities
+
+def _load_data():
+    """
+    Loads the parsed location and activity data into the class-level lookup tables of the Itinerary
+    class. Reuses the pickled tables from the previous run when the cache format and the data files
+    have not changed since, and otherwise parses the data files and refreshes the cache. Takes no
+    parameters. Returns nothing.
+    """
+    
+    header = (_CACHE_VERSION, os.path.getmtime(_LOCATION_PATH), os.path.getmtime(_ACTIVITY_PATH))
+    
+    # Any cache that cannot be read or does not hold the expected tables is treated as missing.
+    try:
+        with open(_CACHE_PATH, "rb") as cache_file:
+            cached_header, locations, activities = pickle.load(cache_file)
+        if not isinstance(locations, dict) or not isinstance(activities, dict):
+            cached_header = None
+    except Exception:
+        cached_header = None
+    
+    if cached_header != header:
+        locations, activities = _parse_data()
+        
+        # The cache is only an optimization, so a data folder that cannot be written to is ignored.
+        try:
+            with open(_CACHE_PATH, "wb") as cache_file:
+                pickle.dump((header, locations, activities), cache_file)
+        except OSError:
+            pass
+    
+    Itinerary._locations = locations
+    Itinerary._activities = activities
+    Itinerary._data_loaded = True
 
 class Itinerary():
     """
     This class generates a travel itinerary based on user preferences, including destination, duration,
     styles, and transport.
     """
+    
+    # Stores the instance variables in fixed slots instead of a per-instance dictionary.
+    __slots__ = ("__name", "__destination", "__duration", "__styles", "__style_tags", "__transport", \
+                 "__activity_buffer", "__line_buffer")
+    
+    # Parsed location and activity data, shared by every instance. Populated once by _load_data.
+    _locations = {}
+    _activities = {}
+    _data_loaded = False
 
     def __init__(self):
         """
@@ -23,27 +116,18 @@ class Itinerary():
         
         self.__name = ""
         self.__destination = ""
-        self.__duration = ""
+        self.__duration = 0
         self.__styles = []
+        self.__style_tags = []
         self.__transport = ""
-
-    def open_data(self):
-        """
-        Opens the data files containing location and activity information. Takes no parameters. Returns
-        nothing.
-        """
         
-        self.location_file = open("itinerary_data/locations.txt", "r")
-        self.activity_file = open("itinerary_data/activities.txt", "r")
-
-    def close_data(self):
-        """
-        Closes the data files containing location and activity information. Takes no parameters. Returns
-        nothing.
-        """
+        # Lists reused by every itinerary generation instead of being allocated each time.
+        self.__activity_buffer = []
+        self.__line_buffer = []
         
-        self.location_file.close()
-        self.activity_file.close()
+        # Parses the data files the first time an itinerary is created.
+        if not Itinerary._data_loaded:
+            _load_data()
 
     def create_itinerary(self):
         """
@@ -53,67 +137,61 @@ class Itinerary():
         itinerary in text format.
         """
         
-        self.location_file.seek(0)
-        self.activity_file.seek(0)
-
         destination = self.get_destination()
-        styles = self.get_styles()
+        style_tags = self.__style_tags
         duration = self.get_duration()
         transport = self.get_transport()
 
         location_urban_list, location_natural_list = self.select_potential_locations(destination)
         
-        activity_list = self.select_potential_activites(styles)
+        activity_list = self.select_potential_activites(style_tags)
         
         itinerary = self.generate_activity(duration, location_urban_list, location_natural_list, \
                                             activity_list, transport, destination)
 
         return itinerary
 
-    def select_potential_locations(self, destination):
+    def copy(self):
         """
-        Selects potential urban and natural locations based on the provided destination. Iterates through
-        the location data and separates urban and natural attractions for the specified destination. The
-        destination is passed as a string parameter. Returns two lists: a list of urban attractions and
-        a list of natural attractions.
+        Creates a new itinerary with the same name, destination, duration, styles, and transport as this
+        itinerary, and its own buffers, so it can be generated independently. Takes no parameters. Returns
+        the new itinerary.
         """
         
-        location_urban_list = []
-        location_natural_list = []
-        reached_relevant_block = False
+        itinerary_copy = Itinerary()
+        itinerary_copy.__name = self.__name
+        itinerary_copy.__destination = self.__destination
+        itinerary_copy.__duration = self.__duration
+        itinerary_copy.__styles = list(self.__styles)
+        itinerary_copy.__style_tags = list(self.__style_tags)
+        itinerary_copy.__transport = self.__transport
         
-        for line in self.location_file:
-            
-            if destination in line and "urban_attraction" in line:
-                reached_relevant_block = True
-                location_urban_list.append(line.replace(destination, "")\
-                                           .replace("urban_attraction", "").strip())
-                
-            elif destination in line and "natural_attraction" in line:
-                reached_relevant_block = True
-                location_natural_list.append(line.replace(destination, "")\
-                                             .replace("natural_attraction", "").strip())
-                
-            elif reached_relevant_block:
-                break
-                
-        return location_urban_list, location_natural_list
+        return itinerary_copy
+
+    def select_potential_locations(self, destination):
+        """
+        Selects potential urban and natural locations based on the provided destination. Looks up the
+        parsed location data for the specified destination. The destination is passed as a string
+        parameter. Returns two lists: a list of urban attractions and a list of natural attractions.
+        """
+        
+        locations = self._locations[destination]
+        return locations["urban_attraction"], locations["natural_attraction"]
 
-    def select_potential_activites(self, styles):
+    def select_potential_activites(self, style_tags):
         """
-        Selects potential activities based on the specified styles. Iterates through the activity data
-        and selects activities that match the specified travel styles pass as a list. Returns another list
-        of activities that match the selected styles.
+        Selects potential activities based on the specified styles. Looks up the parsed activity data for
+        each of the lowercase travel style tags passed as a list. Returns a list of activities that match
+        the selected styles. The list is reused, and is overwritten by the next call.
         """
         
-        activity_list = []
+        activities = self._activities
+        activity_list = self.__activity_buffer
+        activity_list.clear()
+        
+        for tag in style_tags:
+            activity_list.extend(activities.get(tag, ()))
         
-        for line in self.activity_file:
-            for style in styles:
-                style_tag = "#%s" % style.lower()
-                if style_tag in line:
-                    activity_list.append(line.replace(style_tag, "").strip())
-                    
         return activity_list
 
     def generate_activity(self, duration, location_urban_list, location_natural_list, activity_list, \
@@ -125,30 +203,45 @@ class Itinerary():
         itinerary as a string, with the new activity.
         """
         
-        itinerary = ""
+        itinerary = self.__line_buffer
+        itinerary.clear()
+        append = itinerary.append
+        substitute = _SUB_RE.sub
+        
+        # Draws every day's activity and locations up front, without replacement.
+        activities = self.select_random(activity_list, duration)
+        urban_locations = self.select_random(location_urban_list, duration)
+        natural_locations = self.select_random(location_natural_list, duration)
         
-        for day in range(1, int(duration) + 1):
+        # The replacements shared by every day are set once, and the rest are updated per day.
+        mapping = {"method_of_access": transport.lower(), "location": destination}
+        replacement = lambda match: mapping[match.group(0)]
+        
+        for day, activity, urban_location, natural_location in zip(range(1, duration + 1), activities, \
+                                                                   urban_locations, natural_locations):
             
-            activity = self.select_random(activity_list)
-            activity = activity.replace("urban_attraction", self.select_random(location_urban_list))\
-                               .replace("natural_attraction", self.select_random(location_natural_list))\
-                               .replace("method_of_access", transport.lower())\
-                               .replace("location", destination)\
-                               .replace("#", str(day))
+            mapping["urban_attraction"] = urban_location
+            mapping["natural_attraction"] = natural_location
+            mapping["#"] = str(day)
             
-            itinerary += activity + "\n"
+            append(substitute(replacement, activity))
         
-        return itinerary
+        return "\n".join(itinerary) + "\n"
 
-    def select_random(self, input_list):
+    def select_random(self, input_list, count):
         """
-        Selects a random item from a list passed as a parameter. Returns the randomly selected item from
-        the list.
+        Selects a number of distinct random items from a list. Gets the list and the number of items to
+        select as parameters. Returns a new list of the randomly selected items, leaving the input list
+        unchanged.
         """
         
-        item = random.choice(input_list)
-        input_list.remove(item)
-        return item
+        # For large lists, drawing with replacement rarely repeats an item and is faster than sampling.
+        if len(input_list) > 50 * count:
+            items = random.choices(input_list, k=count)
+            if len(set(items)) == count:
+                return items
+        
+        return random.sample(input_list, count)
 
     def set_name(self, name):
         """
@@ -169,18 +262,19 @@ class Itinerary():
     def set_duration(self, duration):
         """
         Sets the duration instance variable of the itinerary (in days). The duration is passed as a string
-        after stripping any surrounding whitespace. Returns nothing.
+        and stored as an integer, so it should be validated first. Returns nothing.
         """
         
-        self.__duration = duration.strip()
+        self.__duration = int(duration)
 
     def set_styles(self, styles):
         """
         Sets the style instance variable of the itinerary. The styles variable is passed as
-        a list parameter. Returns nothing.
+        a list parameter. Also stores the lowercase style tags used to look up activities. Returns nothing.
         """
         
         self.__styles = styles
+        self.__style_tags = [style.lower() for style in styles]
 
     def set_transport(self, transport):
         """
@@ -251,8 +345,14 @@ class Itinerary():
     def validate_duration(self, duration):
         """
         Validates the duration of the itinerary. The duration, passed as a parameter, must
-        be a digit between 1 and 10 days. Returns a bool; True if the duration is valid, False
+        be a whole number between 1 and 10 days. Returns a bool; True if the duration is valid, False
         otherwise.
         """
+        
+        # Only plain digits are accepted, since int also parses signs and underscores. Some digits, such
+        # as superscripts, still cannot be converted.
         duration = duration.strip()
-        return duration.isdigit() and 0 < int(duration) < 11
\ No newline at end of file
+        try:
+            return duration.isdigit() and 1 <= int(duration) <= 10
+        except ValueError:
+            return False
\ No newline at end of file
@@ -5,9 +5,33 @@ Description: This module defines the TravelPlanner class, which creates a GUI fo
 travel itinerary. It allows users to input their name, destination, travel preferences, and duration.
 """
 
+import queue
+import threading
+from functools import partial
 import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import messagebox, ttk
 from PIL import ImageTk, Image
 
+# The font family used by every widget in the GUI.
+_FONT_FAMILY = 'Segoe UI Semibold'
+
+# The keyword arguments shared by every frame, label, button and entry in the GUI.
+_FRAME_BG = {"bg": "#E9ECF5"}
+_LABEL_KW = {"fg": "#2D4654", "bg": "#E9ECF5"}
+_BTN_KW = {"fg": "#096B72", "bg": "#E9ECF5", "borderwidth": 0, "cursor": "hand2", "highlightcolor": "#172A3A",\
+           "activebackground": "#E9ECF5"}
+_ENTRY_KW = {"fg": "#000000", "bg": "#FFFFFF", "relief": "flat"}
+
+# How often, in milliseconds, the main thread checks for the results of the background threads.
+_POLL_MS = 50
+
+# The destination images, and the resized PIL images keyed by (path, width, height) shared by every TravelPlanner
+# window. Each window converts them into Tk images of its own, since a Tk image belongs to a single interpreter.
+_DESTINATION_IMAGES = ("img/united_kingdom.jpg", "img/france.jpg", "img/canada.jpg", "img/united_states.jpg",\
+                       "img/italy.jpg")
+_IMG_CACHE = {}
+
 class TravelPlanner(tk.Tk):
     """
     This class creates a GUI that the user can interact with to create a custom travel Itinerary.
@@ -21,13 +45,28 @@ class TravelPlanner(tk.Tk):
         # Initializes the parent (tk.Tk) class.
         super().__init__()
         
-        # Gets the window height and width.
-        # Will be used as references for other GUI components.
+        # Gets the window height and width. These are the only Tk queries of the screen size.
+        # Will be used as references for other GUI components, which are derived from them below.
         self.window_height = self.winfo_screenheight()
         self.window_width = self.winfo_screenwidth()
         
+        # Computes the pixel sizes derived from the window height and width once.
+        self.frame_height = int(self.window_height*0.6)
+        self.frame_width = int(self.window_width*0.6)
+        self.preference_height = int(self.window_height*0.4)
+        self.left_preference_width = int(self.window_width*0.18)
+        self.right_preference_width = int(self.window_width*0.28)
+        self.photo_width = int(self.window_width*0.18)
+        self.photo_label_width = int(self.window_width*0.12)
+        self.styles_wraplength = int(self.window_height*0.2)
+        self.itinerary_wraplength = int(self.window_height*0.78)
+        
+        # Creates the named fonts once, so Tk can share them between widgets instead of parsing a font per widget.
+        self.fonts = {size: tkfont.Font(self, family=_FONT_FAMILY, size=size) for size in (10, 15, 18, 20, 30)}
+        self.title_font = tkfont.Font(self, family=_FONT_FAMILY, size=25, slant="italic")
+        
         # Configure the initial appearance and properties of the window.
-        self.geometry("%ix%i" % (int(self.window_width*0.6), int(self.window_height*0.6)))
+        self.geometry("%ix%i" % (self.frame_width, self.frame_height))
         self.resizable(False, False)
         self.title("CustomVacay Travel Assistant")
         
@@ -43,30 +82,52 @@ class TravelPlanner(tk.Tk):
         self.itinerary_display_var = tk.StringVar()
         self.error_type_display_var = tk.StringVar()
         
-        # Initializes the GUI elements.
+        # Initializes the frames. The widgets of each frame are built the first time it is displayed.
         self.init_frames()
         self.init_images()
-        self.init_entry()
-        self.init_checkboxes()
-        self.init_radios()
-        self.init_labels()
-        self.init_buttons()
+        self.name_entry = None
+        self.duration_entry = None
+        
+        # The itinerary is created on a background thread from a copy of the itinerary object, which hands its
+        # result back through a queue that the main thread polls while a copy is pending. Only the result of the
+        # latest submitted copy is displayed.
+        self.itinerary_job = None
+        self.itinerary_results = queue.Queue()
+        self.itinerary_poll = None
         
         # Tracks the current frame index
         # Defines the order of frames to cycle through in the program.
         self.current_frame = 0
-        self.frame_cycle = [self.menu_frame,\
+        self.frame_cycle = (self.menu_frame,\
                             self.name_entry_frame,\
                             self.destination_frame_one,\
                             self.destination_frame_two,\
                             self.travel_preferences_frame,\
-                            self.itinerary_frame]
+                            self.itinerary_frame)
+        
+        # Tracks the frame currently displayed, so it can be hidden without looking it up in the frame cycle.
+        self.current_frame_widget = self.frame_cycle[self.current_frame]
+        
+        # Maps each frame to the method that builds its widgets, and tracks the frames already built.
+        self.frame_builders = {self.menu_frame: self.build_menu_frame,\
+                               self.name_entry_frame: self.build_name_entry_frame,\
+                               self.destination_frame_one: self.build_destination_frame_one,\
+                               self.destination_frame_two: self.build_destination_frame_two,\
+                               self.travel_preferences_frame: self.build_travel_preferences_frame,\
+                               self.itinerary_frame: self.build_itinerary_frame,\
+                               self.error_frame: self.build_error_frame}
+        self.built_frames = set()
 
     def init_frames(self):
         """
         Initializes frames used in the GUI.
         """
         
+        # Creates the container that every main frame is displayed in.
+        # Created first, so that the main frames are stacked above it.
+        self.frame_container = self.default_frame_template()
+        self.frame_container.place(relx=0, rely=0, relwidth=1, relheight=1)
+        
         # Creates the main frames.
         self.menu_frame = self.default_frame_template()
         self.name_entry_frame = self.default_frame_template()
@@ -76,316 +137,381 @@ class TravelPlanner(tk.Tk):
         self.itinerary_frame = self.default_frame_template()
         self.error_frame = self.default_frame_template()
 
-        # Creates frames for the travel preference frame.
-        self.left_preference_frame = tk.Frame(self.travel_preferences_frame,\
-                                              height=int(self.window_height*0.4),\
-                                              width=int(self.window_width*0.18),\
-                                              bg="#E9ECF5")
-        self.left_preference_frame.place(relx=0.28, rely=0.6, anchor="center")
-        
-        self.right_preference_frame = tk.Frame(self.travel_preferences_frame,\
-                                               height=int(self.window_height*0.4),\
-                                               width=int(self.window_width*0.28),\
-                                               bg="#E9ECF5")
-        self.right_preference_frame.place(relx=0.65, rely=0.6, anchor="center")
-
     def default_frame_template(self):
-        """Returns a default frame template with specific height, width and color. A helper method
-        of the init_frames method. Has no parameters and returns nothing."""
+        """Returns a default frame template with a specific color. The frame is sized by its placement,
+        filling the window. A helper method of the init_frames method. Has no parameters and returns nothing."""
         
-        return tk.Frame(self,\
-                        height=int(self.window_height*0.6),\
-                        width=int(self.window_width*0.6),\
-                        bg="#E9ECF5")
-    
-    def init_images(self):
+        return tk.Frame(self, **_FRAME_BG)
+
+    def ensure_built(self, frame):
         """
-        Initializes images used in the GUI.
+        Builds the widgets of a frame if they have not been built yet. Takes the frame as a parameter. Returns
+        nothing.
         """
         
-        self.tk_uk_img = self.config_img(Image.open("img/united_kingdom.jpg"))
-        self.tk_fr_img = self.config_img(Image.open("img/france.jpg"))
-        self.tk_ca_img = self.config_img(Image.open("img/canada.jpg"))
-        self.tk_us_img = self.config_img(Image.open("img/united_states.jpg"))
-        self.tk_it_img = self.config_img(Image.open("img/italy.jpg"))
+        if frame not in self.built_frames:
+            self.built_frames.add(frame)
+            self.frame_builders[frame]()
 
-    def config_img(self, img):
+    def build_menu_frame(self):
         """
-        Returns an image applied with a specific cropping height, width, and resampling filter. A helper method
-        of the init_images method. Takes an image as a parameter. Returns the image with the formatting applied.
+        Builds the widgets of the menu frame.
         """
         
-        return ImageTk.PhotoImage(img.resize((int(self.window_width*0.18),\
-                                              int(self.window_height*0.6)),\
-                                             Image.Resampling.LANCZOS))
-    
-    def init_entry(self):
+        # Creates the labels for the menu frame.
+        self.place_labels(((self.menu_frame, {"text": "Travel Assistant", "font": self.title_font},\
+                            None, 0.6, 0.5, "center"),\
+                           (self.menu_frame, {"text": "CustomVacay", "fg": "#87BCDE"}, 30, 0.4, 0.405, "center")))
+        
+        # Creates the buttons for the menu frame.
+        self.config_btn(tk.Button(self.menu_frame, width=15, text="Start Planning", command=self.display_next_frame))\
+                                                   .place(relx=0.5, rely=0.65, anchor="center")
+        self.config_btn(tk.Button(self.menu_frame, width=5, text="Quit", command=self.end_program))\
+                                                   .place(relx=0.70, rely=0.65, anchor="center")
+
+    def build_name_entry_frame(self):
         """
-        Initializes entries used in the GUI.
+        Builds the widgets of the name entry frame.
         """
         
+        # Creates the entry for the name entry frame.
         self.name_entry = self.config_entry(tk.Entry(self.name_entry_frame, textvariable=self.name_display_var, width=20))
-        self.duration_entry = self.config_entry(tk.Entry(self.right_preference_frame, textvariable=self.duration_display_var, width=4))
-        self.duration_entry.place(relx=0.46, rely=0.6, anchor="w")
         self.name_entry.place(relx=0.6, rely=0.5, anchor="center")
+        
+        # Creates the labels for the name entry frame.
+        self.place_labels(((self.name_entry_frame, {"text": "Personal Information"}, 20, 0.3, 0.3, "center"),\
+                           (self.name_entry_frame, {"text": "Name"}, 18, 0.25, 0.5, "center")))
+        
+        # Creates the buttons for the name entry frame.
+        self.config_btn(tk.Button(self.name_entry_frame, width=15, text=">>>Next>>>",\
+                                  command=self.process_name_input)).place(relx=0.5, rely=0.65, anchor="center")
+        self.config_btn(tk.Button(self.name_entry_frame, width=9, text="< Restart",\
+                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
 
-    def config_entry(self, entry):
+    def build_destination_frame_one(self):
         """
-        Returns an entry applied with a specific color, background color, font, and text size. A helper method
-        of the init_entry method. Takes an entry as a parameter. Returns the entry with the formatting applied.
+        Builds the widgets of the first destination frame.
         """
         
-        entry.config(fg="#000000",\
-                     bg="#FFFFFF",\
-                     relief="flat",\
-                     font=('Segoe UI Semibold', 15))
+        # Creates the labels for the first destination frame.
+        self.place_labels(((self.destination_frame_one, {"text": "Destinations"}, 20, 0.88, 0.3, "center"),))
+        self.config_photo_label(tk.Label(self.destination_frame_one), "img/united_kingdom.jpg")\
+                                                                     .place(relx=0.05, rely=0.5, anchor="w")
+        self.config_photo_label(tk.Label(self.destination_frame_one), "img/france.jpg")\
+                                                                     .place(relx=0.3, rely=0.5, anchor="w")
+        self.config_photo_label(tk.Label(self.destination_frame_one), "img/canada.jpg")\
+                                                                     .place(relx=0.55, rely=0.5, anchor="w")
         
-        return entry
-    
-    def init_checkboxes(self):
+        # Creates the country selection buttons for the first destination frame.
+        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="United Kingdom", \
+                                  command=partial(self.process_destination_input, "United Kingdom")))\
+                                  .place(relx=0.15, rely=0.8, anchor="center")
+        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="France",\
+                                  command=partial(self.process_destination_input, "France")))\
+                                  .place(relx=0.4, rely=0.8, anchor="center")
+        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="Canada",\
+                                  command=partial(self.process_destination_input, "Canada")))\
+                                  .place(relx=0.65, rely=0.8, anchor="center")
+        
+        # Creates the cycle frame buttons in the first destination frame.
+        self.config_btn(tk.Button(self.destination_frame_one, width=15, text=">>> >>>\nMore Locations\n>>> >>>",\
+                                  command=self.display_next_frame)).place(relx=0.88, rely=0.5, anchor="center")
+        self.config_btn(tk.Button(self.destination_frame_one, width=9, text="< Restart",\
+                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
+
+    def build_destination_frame_two(self):
         """
-        Initializes checkboxes used in the GUI.
+        Builds the widgets of the second destination frame.
         """
         
-        self.adventure_style = tk.BooleanVar()
-        self.relaxation_style = tk.BooleanVar()
-        self.cultural_style = tk.BooleanVar()
-        self.luxury_style = tk.BooleanVar()
-        self.family_style = tk.BooleanVar()
-
-        self.config_checkboxes(tk.Checkbutton(self.left_preference_frame, text="Adventure",\
-                                              variable=self.adventure_style)).place(relx=0.1, rely=0.25, anchor="w")
-        self.config_checkboxes(tk.Checkbutton(self.left_preference_frame, text="Relaxation",\
-                                              variable=self.relaxation_style)).place(relx=0.1, rely=0.4, anchor="w")
-        self.config_checkboxes(tk.Checkbutton(self.left_preference_frame, text="Cultural",\
-                                              variable=self.cultural_style)).place(relx=0.1, rely=0.55, anchor="w")
-        self.config_checkboxes(tk.Checkbutton(self.left_preference_frame, text="Luxury",\
-                                              variable=self.luxury_style)).place(relx=0.1, rely=0.7, anchor="w")
-        self.config_checkboxes(tk.Checkbutton(self.left_preference_frame, text="Family",\
-                                              variable=self.family_style)).place(relx=0.1, rely=0.85, anchor="w")
+        # Creates the labels for the second destination frame.
+        self.place_labels(((self.destination_frame_two, {"text": "Destinations"}, 20, 0.88, 0.3, "center"),))
+        self.config_photo_label(tk.Label(self.destination_frame_two), "img/united_states.jpg")\
+                                                                     .place(relx=0.15, rely=0.5, anchor="w")
+        self.config_photo_label(tk.Label(self.destination_frame_two), "img/italy.jpg")\
+                                                                     .place(relx=0.45, rely=0.5, anchor="w")
+        
+        # Creates the country selection buttons for the second destination frame.
+        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="United States",\
+                                  command=partial(self.process_destination_input, "United States")))\
+                                  .place(relx=0.25, rely=0.8, anchor="center")
+        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="Italy",\
+                                  command=partial(self.process_destination_input, "Italy")))\
+                                  .place(relx=0.55, rely=0.8, anchor="center")
+        
+        # Creates the cycle frame button in the second destination frame.
+        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="<<< <<<\nReturn\n<<< <<<",\
+                                  command=self.display_previous_frame)).place(relx=0.88, rely=0.5, anchor="center")
 
-    def config_checkboxes(self, checkbox):
+    def build_travel_preferences_frame(self):
         """
-        Returns a checkbox applied with a specific color, background color, font, and text size. A helper method
-        of the init_checkboxes method. Takes a checkbox as a parameter. Returns the checkbox with the formatting
-        applied.
+        Builds the widgets of the travel preferences frame.
         """
         
-        checkbox.config(fg="#2D4654",\
-                        bg="#E9ECF5",\
-                        font=('Segoe UI Semibold', 15),\
-                        activebackground="#E9ECF5")
+        # Creates frames for the travel preference frame.
+        self.left_preference_frame = tk.Frame(self.travel_preferences_frame, height=self.preference_height,\
+                                              width=self.left_preference_width, **_FRAME_BG)
+        self.left_preference_frame.place(relx=0.28, rely=0.6, anchor="center")
         
-        return checkbox
-    
-    def init_radios(self):
+        self.right_preference_frame = tk.Frame(self.travel_preferences_frame, height=self.preference_height,\
+                                               width=self.right_preference_width, **_FRAME_BG)
+        self.right_preference_frame.place(relx=0.65, rely=0.6, anchor="center")
+        
+        # Creates the entry, checkboxes and radio buttons for the travel preference frame.
+        self.duration_entry = self.config_entry(tk.Entry(self.right_preference_frame, textvariable=self.duration_display_var, width=4))
+        self.duration_entry.place(relx=0.46, rely=0.6, anchor="w")
+        self.init_styles()
+        self.init_checkboxes()
+        self.init_radios()
+        
+        # Creates the labels for the travel preferences frames.
+        self.place_labels(((self.travel_preferences_frame, {"text": "Travel Preferences"}, 20, 0.25, 0.15, "center"),\
+                           (self.left_preference_frame, {"text": "Travel Style"}, 18, 0.1, 0.1, "w"),\
+                           (self.right_preference_frame, {"text": "Transportation"}, 18, 0.1, 0.1, "w"),\
+                           (self.right_preference_frame, {"text": "Duration:"}, 18, 0.1, 0.6, "w"),\
+                           (self.right_preference_frame, {"text": "Days"}, 18, 0.65, 0.6, "w"),\
+                           (self.right_preference_frame, {"text": "Maximum 10 Days*"}, 10, 0.1, 0.7, "w")))
+        
+        # Creates the buttons for the travel preference frame.
+        self.config_btn(tk.Button(self.right_preference_frame, width=15, text="Create Itinerary!",\
+                                  command=self.process_preferences_input)).place(relx=0.25, rely=0.9, anchor="w")
+        self.config_btn(tk.Button(self.travel_preferences_frame, width=9, text="< Restart",\
+                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
+
+    def build_itinerary_frame(self):
         """
-        Intializes radio buttons used in the GUI.
+        Builds the widgets of the itinerary frame.
         """
         
-        self.transport_display_var.set("Car")
-        self.config_radio(tk.Radiobutton(self.right_preference_frame, text="Car",\
-                                         value="Car")).place(relx=0.1, rely=0.25, anchor="w")
-        self.config_radio(tk.Radiobutton(self.right_preference_frame, text="Train",\
-                                         value="Train")).place(relx=0.1, rely=0.4, anchor="w")
-        self.config_radio(tk.Radiobutton(self.right_preference_frame, text="Boat",\
-                                         value="Boat")).place(relx=0.5, rely=0.25, anchor="w")
-        self.config_radio(tk.Radiobutton(self.right_preference_frame, text="Plane",\
-                                         value="Plane")).place(relx=0.5, rely=0.4, anchor="w")
+        # Creates the labels for the itinerary frames.
+        self.place_labels(((self.itinerary_frame, {"text": "Itinerary for"}, 20, 0.05, 0.1, "w"),\
+                           (self.itinerary_frame, {"textvariable": self.name_display_var}, 20, 0.25, 0.1, "w"),\
+                           (self.itinerary_frame, {"text": "Destination:"}, 10, 0.05, 0.22, "w"),\
+                           (self.itinerary_frame, {"textvariable": self.destination_display_var}, 10, 0.05, 0.26, "w"),\
+                           (self.itinerary_frame, {"text": "Transportation:"}, 10, 0.05, 0.32, "w"),\
+                           (self.itinerary_frame, {"textvariable": self.transport_display_var}, 10, 0.05, 0.36, "w"),\
+                           (self.itinerary_frame, {"text": "Preferences:"}, 10, 0.05, 0.42, "w"),\
+                           (self.itinerary_frame, {"textvariable": self.selected_styles_display_var,\
+                                                   "wraplength": self.styles_wraplength, "justify": "left"},\
+                            10, 0.05, 0.48, "w"),\
+                           (self.itinerary_frame, {"text": "Duration (Days):"}, 10, 0.05, 0.56, "w"),\
+                           (self.itinerary_frame, {"textvariable": self.duration_display_var}, 10, 0.05, 0.6, "w")))
+        
+        # Creates the label for the custom itinerary on the intinerary frame.
+        self.place_labels(((self.itinerary_frame, {"textvariable": self.itinerary_display_var, "anchor": "nw",\
+                                                   "wraplength": self.itinerary_wraplength, "justify": "left"},\
+                            10, 0.25, 0.18, "nw"),))
+        
+        # Creates the buttons for the itinerary frame.
+        self.config_btn(tk.Button(self.itinerary_frame, width=9, text="< Restart",\
+                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
 
-    def config_radio(self, radio):
+    def build_error_frame(self):
         """
-        Returns a radio button applied with a specific color, background color, font, text size, and active
-        background color. A helper method of the init_radios method. Takes a radio button as a parameter. Returns
-        the radio button with the formatting applied.
+        Builds the widgets of the error frame.
         """
-
-        radio.config(fg="#2D4654",\
-                     bg="#E9ECF5",\
-                     font=('Segoe UI Semibold', 15),\
-                     activebackground="#E9ECF5",\
-                     variable=self.transport_display_var)
         
-        return radio
+        # Creates the label for the error frame.
+        self.place_labels(((self.error_frame, {"textvariable": self.error_type_display_var}, 20, 0.5, 0.5, "center"),))
+        
+        # Creates the buttons for the error frame. Tab is kept on the back button, since the widgets of the frame under
+        # the error frame stay mapped and could otherwise be reached from the keyboard.
+        self.error_back_btn = self.config_btn(tk.Button(self.error_frame, width=15, text="< Back",\
+                                                        command=self.manage_error_frame))
+        self.error_back_btn.place(relx=0.88, rely=0.9, anchor="center")
+        self.error_back_btn.bind("<Tab>", lambda event: "break")
+        self.error_back_btn.bind("<Shift-Tab>", lambda event: "break")
+        
+        # Places the error frame over the container once, stacked beneath it until an error is displayed.
+        self.error_frame.place(in_=self.frame_container, relx=0, rely=0, relwidth=1, relheight=1)
+        self.error_frame.lower()
 
-    def init_labels(self):
+    def init_images(self):
         """
-        Initializes labels used in the GUI.
+        Initializes images used in the GUI. The destination images are decoded and resized on a background thread,
+        so photo labels built before an image is ready show a blank placeholder until it arrives.
         """
         
-        # Creates the labels for the menu frame.
-        tk.Label(self.menu_frame, fg="#2D4654", bg="#E9ECF5", text="Travel Assistant",\
-                 font=('Segoe UI Semibold', 25, "italic")).place(relx=0.6, rely=0.5, anchor="center")
-        tk.Label(self.menu_frame, fg="#87BCDE", bg="#E9ECF5", text="CustomVacay",\
-                 font=('Segoe UI Semibold', 30)).place(relx=0.4, rely=0.405, anchor="center")
-        
-        # Creates the labels for the entry frame.
-        self.config_label(tk.Label(self.name_entry_frame, text="Personal Information"), 20)\
-                                                          .place(relx=0.3, rely=0.3, anchor="center")
-        self.config_label(tk.Label(self.name_entry_frame, text="Name"), 18)\
-                                                          .place(relx=0.25, rely=0.5, anchor="center")
-        
-        # Creates the labels for the destination frames.
-        self.config_label(tk.Label(self.destination_frame_one, text="Destinations"), 20)\
-                                                               .place(relx=0.88, rely=0.3, anchor="center")
-        self.config_label(tk.Label(self.destination_frame_two, text="Destinations"), 20)\
-                                                               .place(relx=0.88, rely=0.3, anchor="center")
-        self.config_photo_label(tk.Label(self.destination_frame_one, image=self.tk_uk_img))\
-                                                                     .place(relx=0.05, rely=0.5, anchor="w")
-        self.config_photo_label(tk.Label(self.destination_frame_one, image=self.tk_fr_img))\
-                                                                     .place(relx=0.3, rely=0.5, anchor="w")
-        self.config_photo_label(tk.Label(self.destination_frame_one, image=self.tk_ca_img))\
-                                                                     .place(relx=0.55, rely=0.5, anchor="w")
-        self.config_photo_label(tk.Label(self.destination_frame_two, image=self.tk_us_img))\
-                                                                     .place(relx=0.15, rely=0.5, anchor="w")
-        self.config_photo_label(tk.Label(self.destination_frame_two, image=self.tk_it_img))\
-                                                                     .place(relx=0.45, rely=0.5, anchor="w")
+        # Tracks the labels waiting for each image, and the Tk images keyed by path once they have been displayed.
+        self.photo_labels = {}
+        self.tk_imgs = {}
+        self.placeholder_img = tk.PhotoImage(width=1, height=1)
         
-        # Creates the labels for the travel preferences frames.
-        self.config_label(tk.Label(self.travel_preferences_frame, text="Travel Preferences"), 20)\
-                                                                  .place(relx=0.25, rely=0.15, anchor="center")
-        self.config_label(tk.Label(self.left_preference_frame, text="Travel Style"), 18)\
-                                                               .place(relx=0.1, rely=0.1, anchor="w")
-        self.config_label(tk.Label(self.right_preference_frame, text="Transportation"), 18)\
-                                                                .place(relx=0.1, rely=0.1, anchor="w")
-        self.config_label(tk.Label(self.right_preference_frame, text="Duration:"), 18)\
-                                                                .place(relx=0.1, rely=0.6, anchor="w")
-        self.config_label(tk.Label(self.right_preference_frame, text="Days"),18)\
-                                                                .place(relx=0.65, rely=0.6, anchor="w")
-        self.config_label(tk.Label(self.right_preference_frame, text="Maximum 10 Days*"), 10)\
-                                                                .place(relx=0.1, rely=0.7, anchor="w")
+        # Tk can only be used from the main thread, so the worker hands its results back through a queue that the
+        # main thread polls.
+        self.image_results = queue.Queue()
+        threading.Thread(target=self.load_images, daemon=True).start()
+        self.after(_POLL_MS, self.display_images)
+
+    def load_images(self):
+        """
+        Decodes and resizes every destination image that has not been cached yet, queueing each image as a (path,
+        image) pair. Runs on a background
+        thread and makes no Tk calls. An image that fails to load stops the loading. The queue always ends with a
+        (None, error) pair, where the error is None if every image loaded. Takes no parameters and returns nothing.
+        """
+        
+        try:
+            for path in _DESTINATION_IMAGES:
+                key = (path, self.photo_width, self.frame_height)
+                
+                if key not in _IMG_CACHE:
+                    # Closes the full-size decoded image as soon as the resized copy has been made.
+                    with Image.open(path) as src:
+                        _IMG_CACHE[key] = self.config_img(src)
+                
+                self.image_results.put((path, _IMG_CACHE[key]))
+        except Exception as error:
+            self.image_results.put((None, error))
+        else:
+            self.image_results.put((None, None))
+
+    def config_img(self, img):
+        """
+        Returns an image applied with a specific cropping height and width. The image is first shrunk by whole
+        factors with a box filter, then resampled to the exact size with a bilinear filter. A helper method of the
+        load_images method. Takes an image as a parameter. Returns the image with the formatting applied.
+        """
         
-        # Creates the labels for the itinerary frames.
-        self.config_label(tk.Label(self.itinerary_frame, text="Itinerary for"), 20)\
-                                                         .place(relx=0.05, rely=0.1, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.name_display_var), 20)\
-                                                         .place(relx=0.25, rely=0.1, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, text="Destination:"), 10)\
-                                                         .place(relx=0.05, rely=0.22, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.destination_display_var), 10)\
-                                                         .place(relx=0.05, rely=0.26, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, text="Transportation:"), 10)\
-                                                         .place(relx=0.05, rely=0.32, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.transport_display_var), 10)\
-                                                         .place(relx=0.05, rely=0.36, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, text="Preferences:"), 10)\
-                                                         .place(relx=0.05, rely=0.42, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.selected_styles_display_var, \
-                                   wraplength=int(self.window_height*0.2), justify="left"), 10)\
-                                                         .place(relx=0.05, rely=0.48, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, text="Duration (Days):"), 10)\
-                                                         .place(relx=0.05, rely=0.56, anchor="w")
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.duration_display_var), 10)\
-                                                         .place(relx=0.05, rely=0.6, anchor="w")
+        size = (self.photo_width, self.frame_height)
         
-        # Creates the label for the custom itinerary on the intinerary frame.
-        self.config_label(tk.Label(self.itinerary_frame, textvariable=self.itinerary_display_var, anchor="nw",\
-                                   wraplength=int(self.window_height*0.78), justify="left"), 10)\
-                                                         .place(relx=0.25, rely=0.18, anchor="nw")
+        # Reduces the image by the whole number part of the downscale before the final resize.
+        factor = (max(img.width // size[0], 1), max(img.height // size[1], 1))
+        # The intermediate reduced image is closed once resized, leaving the input image to the caller.
+        if factor != (1, 1):
+            reduced = img.reduce(factor)
+            resized = reduced.resize(size, Image.Resampling.BILINEAR)
+            reduced.close()
+            return resized
         
-        # Creates the label for the error frame.
-        self.config_label(tk.Label(self.error_frame,textvariable=self.error_type_display_var), 20)\
-                                                     .place(relx=0.5, rely=0.5, anchor="center")
+        return img.resize(size, Image.Resampling.BILINEAR)
+
+    def display_images(self):
+        """
+        Converts the images queued by the background thread into Tk images owned by this window, and displays them
+        on the photo labels waiting for them. Reports an image that failed to load in an error dialog. Runs on the
+        main thread, and polls the queue again until the background thread has finished. Takes no parameters and
+        returns nothing.
+        """
+        
+        while True:
+            try:
+                path, result = self.image_results.get_nowait()
+            except queue.Empty:
+                self.after(_POLL_MS, self.display_images)
+                return
+            
+            # The background thread has finished, with the error that stopped it if there was one.
+            if path is None:
+                break
+            
+            # The resized image stays open in the cache for the next window.
+            tk_img = ImageTk.PhotoImage(result, master=self)
+            self.tk_imgs[path] = tk_img
+            
+            for label in self.photo_labels.pop(path, ()):
+                label.config(image=tk_img)
         
-    def config_label(self, label, size):
+        if result is not None:
+            messagebox.showerror("Image Error", "The destination images could not be loaded:\n" + str(result),\
+                                 parent=self)
+
+    def config_entry(self, entry):
         """
-        Returns a label applied with a specific color, background color, font, and text size. A helper method
-        of the init_labels method. Gets the label and text size as an object and integer parameter respectively.
-        Returns the label with the formatting applied.
+        Returns an entry applied with a specific color, background color, font, and text size. A helper method
+        of the frame builders. Takes an entry as a parameter. Returns the entry with the formatting applied.
         """
         
-        label.config(fg="#2D4654",\
-                     bg="#E9ECF5",\
-                     font=('Segoe UI Semibold', size))
+        entry.configure(**_ENTRY_KW, font=self.fonts[15])
         
-        return label
+        return entry
     
-    def config_photo_label(self, label):
+    def init_styles(self):
         """
-        Returns a label applied with a specific height and width. A helper method of the init_labels method.
-        Takes a label as a parameter. Returns the label with the formatting applied.
+        Initializes the ttk styles shared by the checkboxes and radio buttons, applying a specific color, background
+        color, font, text size, and active background color once for every widget using them.
         """
         
-        label.config(height=int(self.window_height*0.6),\
-                     width=int(self.window_width*0.12))
+        self.ttk_style = ttk.Style(self)
         
-        return label
+        for style_name in ("Pref.TCheckbutton", "Pref.TRadiobutton"):
+            self.ttk_style.configure(style_name, foreground="#2D4654", background="#E9ECF5", font=self.fonts[15])
+            self.ttk_style.map(style_name, background=[("active", "#E9ECF5")])
 
-    def init_buttons(self):
+    def init_checkboxes(self):
         """
-        Initializes buttons used in the GUI.
+        Initializes checkboxes used in the GUI.
         """
         
-        # Creates the buttons for the menu frame.
-        self.config_btn(tk.Button(self.menu_frame, width=15, text="Start Planning", command=self.display_next_frame))\
-                                                   .place(relx=0.5, rely=0.65, anchor="center")
-        self.config_btn(tk.Button(self.menu_frame, width=5, text="Quit", command=self.end_program))\
-                                                   .place(relx=0.70, rely=0.65, anchor="center")
+        # Pairs each travel style with the variable tracking whether it is selected.
+        self.style_vars = tuple((style, tk.BooleanVar()) for style in \
+                                ("Adventure", "Relaxation", "Cultural", "Luxury", "Family"))
         
-        # Creates the buttons for the name entry frame.
-        self.config_btn(tk.Button(self.name_entry_frame, width=15, text=">>>Next>>>",\
-                                  command=self.process_name_input)).place(relx=0.5, rely=0.65, anchor="center")
-        self.config_btn(tk.Button(self.name_entry_frame, width=9, text="< Restart",\
-                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
+        for (style, style_var), rely in zip(self.style_vars, (0.25, 0.4, 0.55, 0.7, 0.85)):
+            ttk.Checkbutton(self.left_preference_frame, text=style, variable=style_var,\
+                            style="Pref.TCheckbutton").place(relx=0.1, rely=rely, anchor="w")
+    
+    def init_radios(self):
+        """
+        Intializes radio buttons used in the GUI.
+        """
         
-        # Creates the buttons for the destination frame.
-        # Creates the country selection buttons for the destination frame.
-        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="United Kingdom", \
-                                  command=lambda: self.process_destination_input("United Kingdom")))\
-                                  .place(relx=0.15, rely=0.8, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="France",\
-                                  command=lambda: self.process_destination_input("France")))\
-                                  .place(relx=0.4, rely=0.8, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_one, width=15, text="Canada",\
-                                  command=lambda: self.process_destination_input("Canada")))\
-                                  .place(relx=0.65, rely=0.8, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="United States",\
-                                  command=lambda: self.process_destination_input("United States")))\
-                                  .place(relx=0.25, rely=0.8, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="Italy",\
-                                  command=lambda: self.process_destination_input("Italy")))\
-                                  .place(relx=0.55, rely=0.8, anchor="center")
-        # Creates the cycle frame buttons in the destination frames.
-        self.config_btn(tk.Button(self.destination_frame_one, width=15, text=">>> >>>\nMore Locations\n>>> >>>",\
-                                  command=self.display_next_frame)).place(relx=0.88, rely=0.5, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_one, width=9, text="< Restart",\
-                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
-        self.config_btn(tk.Button(self.destination_frame_two, width=15, text="<<< <<<\nReturn\n<<< <<<",\
-                                  command=self.display_previous_frame)).place(relx=0.88, rely=0.5, anchor="center")
+        self.transport_display_var.set("Car")
         
-        # Creates the buttons for the travel preference frame.
-        self.config_btn(tk.Button(self.right_preference_frame, width=15, text="Create Itinerary!",\
-                                  command=self.process_preferences_input)).place(relx=0.25, rely=0.9, anchor="w")
-        self.config_btn(tk.Button(self.travel_preferences_frame, width=9, text="< Restart",\
-                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
+        for transport, relx, rely in (("Car", 0.1, 0.25), ("Train", 0.1, 0.4), ("Boat", 0.5, 0.25), ("Plane", 0.5, 0.4)):
+            ttk.Radiobutton(self.right_preference_frame, text=transport, value=transport,\
+                            variable=self.transport_display_var,\
+                            style="Pref.TRadiobutton").place(relx=relx, rely=rely, anchor="w")
+
+    def place_labels(self, specs):
+        """
+        Creates and places labels with a specific color, background color, font, and text size. A helper method
+        of the frame builders. Gets the labels as a tuple of (frame, options, text size, relx, rely, anchor)
+        specifications, where the options dict holds the text or textvariable and any overriding label options.
+        A font in the options replaces the named font, and its text size is then given as None and unused.
+        Returns nothing.
+        """
         
-        # Creates the buttons for the itinerary frame.
-        self.config_btn(tk.Button(self.itinerary_frame, width=9, text="< Restart",\
-                                  command=self.restart_program)).place(relx=0.88, rely=0.9, anchor="center")
+        # Passes every option to the constructor, so each label is created, configured and placed in two calls.
+        for frame, options, size, relx, rely, anchor in specs:
+            label_options = {**_LABEL_KW, **options}
+            if "font" not in label_options:
+                label_options["font"] = self.fonts[size]
+            tk.Label(frame, **label_options).place(relx=relx, rely=rely, anchor=anchor)
+    
+    def config_photo_label(self, label, path):
+        """
+        Returns a label applied with a specific height, width and destination image. If the image is still being
+        loaded, the label shows a placeholder and is updated once the image is ready. A helper method of the
+        destination frame builders. Takes a label and the image path as parameters. Returns the label with the
+        formatting applied.
+        """
+        
+        tk_img = self.tk_imgs.get(path)
         
-        # Creates the buttons for the error frame.
-        self.config_btn(tk.Button(self.error_frame, width=15, text="< Back",\
-                                  command=self.manage_error_frame)).place(relx=0.88, rely=0.9, anchor="center")
+        if tk_img is None:
+            tk_img = self.placeholder_img
+            self.photo_labels.setdefault(path, []).append(label)
         
+        label.config(image=tk_img,\
+                     height=self.frame_height,\
+                     width=self.photo_label_width)
+        
+        return label
+
     def config_btn(self, btn):
         """
         Returns a button applied with a specific color, background color, border width, cursor style, hightlight color,
-        active background color, and font. Also applies the button hover styles. A helper method of the init_buttons
-        method. Takes a button as a parameter. Returns the button with the formatting applied.
+        active background color, and font. Also applies the button hover styles. A helper method of the frame
+        builders. Takes a button as a parameter. Returns the button with the formatting applied.
         """
         
         # Applies the default styles.
-        btn.config(fg="#096B72",\
-                   bg="#E9ECF5",\
-                   borderwidth=0,\
-                   cursor="hand2",\
-                   highlightcolor="#172A3A",\
-                   activebackground="#E9ECF5",\
-                   font=('Segoe UI Semibold', 15))
+        btn.configure(**_BTN_KW, font=self.fonts[15])
         
         # Applies the hover and unhover styles.
-        btn.bind("<Enter>", btn.config(fg="#A5D8D3"))
-        btn.bind("<Leave>", btn.config(fg="#096B72"))
+        btn.bind("<Enter>", lambda event, btn=btn: btn.config(fg="#A5D8D3"))
+        btn.bind("<Leave>", lambda event, btn=btn: btn.config(fg="#096B72"))
         
         return btn
     
@@ -396,18 +522,12 @@ class TravelPlanner(tk.Tk):
         
         # Starts the frame cycle. 
         self.display_next_frame(0)
-        
-        # Opens the program data.
-        self.itinerary.open_data()
 
     def end_program(self):
         """
         Ends the program. Takes no parameters and returns nothing.
         """
         
-        # Closes the program data.
-        self.itinerary.close_data()
-        
         # Destroys the window.
         self.destroy()
 
@@ -416,24 +536,28 @@ class TravelPlanner(tk.Tk):
         Restarts the program. Takes no parameters and returns nothing.
         """
         
-        # Resets to the first frame.
-        self.frame_cycle[self.current_frame].place_forget()
+        # Resets to the first frame, discarding any itinerary still being created.
         self.current_frame = 0
-        self.display_next_frame(0)
+        self.swap_frame(self.frame_cycle[self.current_frame])
+        self.itinerary_job = None
         
-        # Unlocks entry widgets.
-        self.name_entry.config(state=tk.NORMAL)
-        self.duration_entry.config(state=tk.NORMAL)
+        # Unlocks the entry widgets that have been built.
+        for entry in (self.name_entry, self.duration_entry):
+            if entry is not None:
+                entry.config(state=tk.NORMAL)
 
     def process_name_input(self):
         """
         Handles the name input and validates it.
         """
         
-        if self.itinerary.validate_name(self.name_display_var.get()):
+        # Reads the name input once.
+        name = self.name_display_var.get()
+        
+        if self.itinerary.validate_name(name):
             
             # Sets the user name input into the itinerary object.
-            self.itinerary.set_name(self.name_display_var.get())
+            self.itinerary.set_name(name)
             
             # Locks the name entry widget.
             self.name_entry.config(state=tk.DISABLED)
@@ -467,20 +591,18 @@ class TravelPlanner(tk.Tk):
         """Handles the travel preferences input and validates them."""
         
         # Gets the user's preference styles as a list
-        styles_list = []
-        if self.adventure_style.get(): styles_list.append("Adventure")
-        if self.relaxation_style.get(): styles_list.append("Relaxation")
-        if self.cultural_style.get(): styles_list.append("Cultural")
-        if self.luxury_style.get(): styles_list.append("Luxury")
-        if self.family_style.get(): styles_list.append("Family")
+        styles_list = [style for style, style_var in self.style_vars if style_var.get()]
+        
+        # Reads the duration input once.
+        duration = self.duration_display_var.get()
         
         # Validates whether the necessary information has been given.
-        if self.itinerary.validate_styles(styles_list) and self.itinerary.validate_duration(self.duration_display_var.get()):
+        if self.itinerary.validate_styles(styles_list) and self.itinerary.validate_duration(duration):
             
             # Sets the user preferences input into the itinerary object.
             self.itinerary.set_styles(styles_list)
             self.itinerary.set_transport(self.transport_display_var.get()) 
-            self.itinerary.set_duration(self.duration_display_var.get())
+            self.itinerary.set_duration(duration)
             
             # Locks the duration entry widget.
             self.duration_entry.config(state=tk.DISABLED)
@@ -489,25 +611,82 @@ class TravelPlanner(tk.Tk):
             self.duration_display_var.set(self.itinerary.get_duration())
             self.selected_styles_display_var.set(str(", ".join(styles_list)))
             
-            # Creates the itinerary and assigns to the itineary display.
-            self.itinerary_display_var.set(self.itinerary.create_itinerary())
-            
-            # Displays the next frame.
+            # Displays the next frame, then creates the itinerary in the background and assigns it to the itinerary
+            # display once it is ready.
+            self.itinerary_display_var.set("Generating itinerary...")
             self.display_next_frame()
+            
+            # Each submit creates the itinerary from its own copy, so the worker never shares the itinerary object or
+            # its buffers with the main thread or with an earlier worker.
+            self.itinerary_job = self.itinerary.copy()
+            threading.Thread(target=self.generate_itinerary, args=(self.itinerary_job,), daemon=True).start()
+            
+            # Starts polling for the result, unless the queue is already being polled for an earlier copy.
+            if self.itinerary_poll is None:
+                self.itinerary_poll = self.after(_POLL_MS, self.display_itinerary)
         else:
             
             # Displays the error frame.
             self.manage_error_frame(True, "Preference(s)")
     
+    def generate_itinerary(self, job):
+        """
+        Creates the itinerary from the preferences set in a copy of the itinerary object, or an error message if it
+        could not be created, and queues it as a (copy, result) pair. Runs on a background thread and makes no Tk
+        calls. Takes the itinerary copy as a parameter and returns nothing.
+        """
+        
+        try:
+            result = job.create_itinerary()
+        except Exception as error:
+            result = "The itinerary could not be generated:\n" + str(error)
+        
+        self.itinerary_results.put((job, result))
+
+    def display_itinerary(self):
+        """
+        Assigns the itinerary queued by the background thread to the itinerary display, ignoring the results of
+        copies that have since been replaced or discarded. Runs on the main thread, and polls the queue again until
+        the result of the latest copy has arrived. Takes no parameters and returns nothing.
+        """
+        
+        while True:
+            try:
+                job, result = self.itinerary_results.get_nowait()
+            except queue.Empty:
+                break
+            
+            if job is self.itinerary_job:
+                self.itinerary_display_var.set(result)
+                self.itinerary_job = None
+        
+        # Stops polling once no copy is pending, including after a restart discards it.
+        if self.itinerary_job is None:
+            self.itinerary_poll = None
+        else:
+            self.itinerary_poll = self.after(_POLL_MS, self.display_itinerary)
+
+    def swap_frame(self, next_frame):
+        """
+        Hides the current frame and displays the next frame in the frame container, building the next frame first
+        if needed. Both geometry changes are then processed together, so the swap is drawn in a single pass. Gets
+        the next frame as a parameter. Returns nothing.
+        """
+        
+        self.current_frame_widget.place_forget()
+        self.ensure_built(next_frame)
+        next_frame.place(in_=self.frame_container, relx=0, rely=0, relwidth=1, relheight=1)
+        self.current_frame_widget = next_frame
+        self.frame_container.update_idletasks()
+        
     def display_next_frame(self, increment=1):
         """
         Hides the current frame, increases the frame index, and displays the next frame at the center of the window.
         Gets the increment amount as a integer parameter that is default set to 1. Returns nothing.
         """
         
-        self.frame_cycle[self.current_frame].place_forget()
         self.current_frame += increment
-        self.frame_cycle[self.current_frame].place(relx=0.5, rely=0.5, anchor="center")
+        self.swap_frame(self.frame_cycle[self.current_frame])
         
     def display_previous_frame(self, increment=1):
         """
@@ -515,13 +694,14 @@ class TravelPlanner(tk.Tk):
         Gets the increment amount as a integer parameter that is default set to 1. Returns nothing.
         """
         
-        self.frame_cycle[self.current_frame].place_forget()
         self.current_frame -= increment
-        self.frame_cycle[self.current_frame].place(relx=0.5, rely=0.5, anchor="center")
+        self.swap_frame(self.frame_cycle[self.current_frame])
         
     def manage_error_frame(self, display=False, error="Input"):
         """
-        Toggles between displaying the error frame with a custom error message and the current frame. The display parameter
+        Toggles between displaying the error frame with a custom error message and the current frame. The error frame
+        stays placed over the current frame and is only raised above or lowered beneath it. While it is displayed, it
+        holds the focus and grabs the input, so the widgets of the current frame cannot be used. The display parameter
         tracks whether to display or hide the error frame and is given as a bool parameter which is set to False by default and
         the error string parameter modifies the error frame with the type of error and is set to "Input" by default. Returns
         nothing.
@@ -529,8 +709,11 @@ class TravelPlanner(tk.Tk):
         
         if display:
             self.error_type_display_var.set("Invalid " + error)
-            self.frame_cycle[self.current_frame].place_forget()
-            self.error_frame.place(relx=0.5, rely=0.5, anchor="center")
+            self.ensure_built(self.error_frame)
+            self.error_frame.lift()
+            self.error_back_btn.focus_set()
+            self.error_frame.grab_set()
         else:
-            self.error_frame.place_forget()
-            self.frame_cycle[self.current_frame].place(relx=0.5, rely=0.5, anchor="center")
\ No newline at end of file
+            self.error_frame.grab_release()
+            self.error_frame.lower()
+            self.focus_set()
\ No newline at end of file